@@ -1,39 +1,132 @@
 
 import os
 import re
+import queue
+import pickle
+import hashlib
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
 import pytesseract
 from PIL import Image
-import pdf2image
-import spacy
-from langdetect import detect
-from googletrans import Translator
+from preprocessing import binarize
+from langdetect import detect, DetectorFactory
 import warnings
 
 # Suppress warnings for cleaner output
 warnings.filterwarnings("ignore")
 
-@dataclass
+# langdetect is randomized; pin it so detection is deterministic and cacheable
+DetectorFactory.seed = 0
+
+# Prefer the in-process Tesseract API when available; pages are already OCR'd
+# in parallel, so keep Tesseract's own OpenMP threading out of the way
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+try:
+    from tesserocr import PyTessBaseAPI, OEM
+except ImportError:
+    PyTessBaseAPI = None
+
+# Pre-compiled patterns shared by all DocumentAnalyzer instances
+_PAN_RE = re.compile(r'[A-Z]{5}[0-9]{4}[A-Z]')
+_GSTIN_RE = re.compile(r'\d{2}[A-Z]{5}\d{4}[A-Z][1-9A-Z]Z[0-9A-Z]')
+_DATE_RE = re.compile(
+    r'(\d{4})-(\d{1,2})-(\d{1,2})'         # YYYY-MM-DD
+    r'|(\d{1,2})/(\d{1,2})/(\d{4}|\d{2})'  # DD/MM/YYYY, DD/MM/YY
+    r'|(\d{1,2})-(\d{1,2})-(\d{4})'        # DD-MM-YYYY
+)
+# Rs. 10,000.00 / INR 10000 / ₹500 / Penalty: 10,000
+# Currency-prefixed amounts win over bare "Penalty ..." hits, which can pick up section numbers;
+# a "Penalty" hit followed by its own currency token counts as currency-prefixed
+_AMOUNT_RE = re.compile(
+    r'(?:(?P<currency>Rs\.?|INR|₹)'
+    r'|(?P<penalty>Penalty)[^0-9₹]{0,20}?(?P<penalty_currency>Rs\.?|INR|₹)?)'
+    r'\s*(?P<amount>\d[\d,]*(?:\.\d{1,2})?)',
+    re.IGNORECASE
+)
+_SECTION_RE = re.compile(r'Section\s*(\d+[A-Za-z]*(?:\s*\([^)]+\))?)', re.IGNORECASE)
+_OFFICE_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'Issuing Office:\s*(.+)',
+    r'Office\s*of\s*the\s*(.+)',
+    r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s*Income Tax Office)'
+))
+
+# Notice type keywords; the earliest keyword in the text decides the type
+_NOTICE_KEYWORDS = (
+    ("Scrutiny Notice", ("scrutiny", "examination", "verification")),
+    ("Demand Notice", ("demand", "payable", "outstanding")),
+    ("Penalty Notice", ("penalty", "fine", "punishment")),
+    ("Intimation", ("intimation", "information", "communication"))
+)
+
+# Single-pass classifiers over all keywords: an Aho-Corasick automaton when
+# pyahocorasick is installed, otherwise one alternation regex with a group per type
+_NOTICE_CLASSIFIER = re.compile(
+    '|'.join(f'(?P<{notice_type.split()[0]}>{"|".join(keywords)})'
+             for notice_type, keywords in _NOTICE_KEYWORDS),
+    re.IGNORECASE
+)
+_GROUP_TO_NAME = {notice_type.split()[0]: notice_type for notice_type, _ in _NOTICE_KEYWORDS}
+
+def _build_notice_automaton():
+    """Aho-Corasick automaton over the lowercase notice keywords, or None without pyahocorasick"""
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+    automaton = ahocorasick.Automaton()
+    for notice_type, keywords in _NOTICE_KEYWORDS:
+        for keyword in keywords:
+            automaton.add_word(keyword, (notice_type, len(keyword)))
+    automaton.make_automaton()
+    return automaton
+
+_NOTICE_AUTOMATON = _build_notice_automaton()
+_MAX_NOTICE_KEYWORD_LEN = max(len(keyword) for _, keywords in _NOTICE_KEYWORDS for keyword in keywords)
+
+# PDFs are OCR'd at low resolution first; pages yielding less text than this are redone at high resolution
+_FAST_PDF_DPI = 150
+_FALLBACK_PDF_DPI = 300
+_MIN_PAGE_CHARS = 100
+
+# Shorter texts are analyzed as-is; the English patterns cope without a translation round-trip
+_MIN_TRANSLATE_CHARS = 200
+_TRANSLATE_CHUNK_CHARS = 4500
+_MAX_TRANSLATE_WORKERS = 8
+
+# Bump whenever extraction or analysis output changes so stale cached results are ignored
+_CACHE_VERSION = 3
+
+_SPACY_DISABLED = ('tagger', 'parser', 'lemmatizer', 'attribute_ruler')
+
+# langdetect codes folded into the two OCR/translation languages this tool handles
+_SOUTH_INDIAN_LANGS = frozenset(('te', 'kn', 'ml', 'ta'))
+_NORTH_INDIAN_LANGS = frozenset(('hi', 'mr', 'bn', 'pa', 'gu'))
+
+@dataclass(slots=True, frozen=True)
 class MonetaryAmount:
     amount: float
     currency: str = "INR"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LegalSection:
     section_number: str
     description: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Metadata:
     original_language: str
     confidence_score: float
 
-@dataclass
+# Not frozen: entity fields are filled in after the main analysis
+@dataclass(slots=True)
 class AnalysisResult:
     metadata: Metadata
     text: Optional[str] = None
+    translated_text: Optional[str] = None
     client_name: Optional[str] = None
     pan_number: Optional[str] = None
     gstin: Optional[str] = None
@@ -44,27 +137,80 @@ class AnalysisResult:
     compliance_deadline: Optional[datetime] = None
     issuing_officer: Optional[str] = None
     issuing_office: Optional[str] = None
+    # Set when some of the text could not be translated (e.g. network errors); such results are not cached
+    translation_failed: bool = False
 
 class DocumentAnalyzer:
-    def __init__(self, tesseract_path: str = None):
+    def __init__(self, tesseract_path: str = None, cache_dir: Union[str, bool] = None, use_ner: bool = False):
         if tesseract_path:
             pytesseract.pytesseract.tesseract_cmd = tesseract_path
+        # Client name and issuing officer come from spaCy NER, which is opt-in; without it spaCy is never loaded
+        self.use_ner = use_ner
+        # spaCy and the translator are loaded on first use
+        self._nlp = None
+        self._translator = None
+        # Idle tesserocr APIs keyed by (lang, psm); each API serves one thread at a time
+        self._tess_pool = {}
+        # Analysis results are cached on disk by the SHA-256 of the document bytes;
+        # cache_dir=False disables the cache, and the directory is created on first write
+        self._cache_dir = None if cache_dir is False else Path(cache_dir or '.legal_doc_cache')
+    
+    @property
+    def nlp(self):
+        """spaCy pipeline, loaded on first use"""
+        if self._nlp is None:
+            import spacy
+            # Only entities and sentence boundaries are used, so skip the heavier components
+            try:
+                nlp = spacy.load('en_core_web_sm', disable=_SPACY_DISABLED)
+            except OSError:
+                os.system('python -m spacy download en_core_web_sm')
+                nlp = spacy.load('en_core_web_sm', disable=_SPACY_DISABLED)
+            nlp.enable_pipe('senter')
+            self._nlp = nlp
+        return self._nlp
+
+    @property
+    def translator(self):
+        """googletrans client, created on first use"""
+        if self._translator is None:
+            from googletrans import Translator
+            self._translator = Translator()
+        return self._translator
+
+    def _ocr(self, image: Image.Image, lang: str = 'eng+hin+tel', psm: int = 6) -> str:
+        """Run Tesseract's LSTM engine on a (pre-binarized) PIL image, in-process via tesserocr when installed"""
+        if PyTessBaseAPI is None:
+            return pytesseract.image_to_string(
+                image, config=f'--oem 1 --psm {psm} -l {lang} -c tessedit_do_invert=0'
+            )
+        
+        pool = self._tess_pool.setdefault((lang, psm), queue.SimpleQueue())
         try:
-            self.nlp = spacy.load('en_core_web_sm')
-        except OSError:
-            os.system('python -m spacy download en_core_web_sm')
-            self.nlp = spacy.load('en_core_web_sm')
-        self.translator = Translator()
+            api = pool.get_nowait()
+        except queue.Empty:
+            api = PyTessBaseAPI(lang=lang, oem=OEM.LSTM_ONLY, psm=psm)
+            api.SetVariable('tessedit_do_invert', '0')
+        try:
+            api.SetImage(image)
+            return api.GetUTF8Text()
+        finally:
+            pool.put(api)
     
     def detect_document_language(self, text: str) -> str:
         """Improved language detection for Indian documents"""
+        return self._detect_lang_cached(text[:500])  # Use first 500 characters for better detection
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _detect_lang_cached(sample: str) -> str:
+        """Language of a text sample, memoized since detection is deterministic"""
         try:
-            sample = text[:500]  # Use first 500 characters for better detection
             lang = detect(sample)
             # Map common Indian language codes
-            if lang in ['te', 'kn', 'ml', 'ta']:
+            if lang in _SOUTH_INDIAN_LANGS:
                 return 'te'  # Treat all South Indian scripts as Telugu for this use case
-            elif lang in ['hi', 'mr', 'bn', 'pa', 'gu']:
+            elif lang in _NORTH_INDIAN_LANGS:
                 return 'hi'  # Treat North Indian languages as Hindi
             return lang
         except:
@@ -73,21 +219,40 @@ class DocumentAnalyzer:
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         """Extract text from PDF with better handling for Indian languages"""
         try:
-            images = pdf2image.convert_from_path(pdf_path)
-            full_text = ""
+            import pdf2image
             
-            # Custom config for Indian languages - prioritize Telugu and Hindi
-            custom_config = r'--oem 3 --psm 6 -l eng+hin+tel'
+            page_count = pdf2image.pdfinfo_from_path(pdf_path)["Pages"]
+            if not page_count:
+                return ""
             
-            for image in images:
-                # First try with Indian language config
-                text = pytesseract.image_to_string(image, config=custom_config)
-                if not text.strip() or len(text.strip()) < 20:
+            def ocr_page_at(page_number, dpi):
+                # Rasterize one page at a time so only in-flight pages are held in memory
+                image = pdf2image.convert_from_path(
+                    pdf_path, dpi=dpi, first_page=page_number, last_page=page_number
+                )[0]
+                image = binarize(image)
+                # First try with Indian languages - prioritize Telugu and Hindi
+                text = self._ocr(image)
+                if len(text.strip()) < 20:
                     # Fallback to English only if no text detected
-                    text = pytesseract.image_to_string(image, config='--oem 3 --psm 6')
-                full_text += text + "\n\n"
+                    text = self._ocr(image, lang='eng')
+                return text
+            
+            def ocr_page(page_number):
+                # Clean printed notices read fine at low DPI; re-render only pages that come back short
+                text = ocr_page_at(page_number, _FAST_PDF_DPI)
+                if len(text.strip()) < _MIN_PAGE_CHARS:
+                    retry = ocr_page_at(page_number, _FALLBACK_PDF_DPI)
+                    if len(retry.strip()) > len(text.strip()):
+                        text = retry
+                return text
+            
+            # Tesseract releases the GIL, so pages can be OCR'd concurrently
+            max_workers = min(os.cpu_count() or 1, page_count)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pages = list(executor.map(ocr_page, range(1, page_count + 1)))
                 
-            return full_text
+            return "".join(page + "\n\n" for page in pages)
         except Exception as e:
             print(f"Error in PDF extraction: {str(e)}")
             return ""
@@ -95,10 +260,11 @@ class DocumentAnalyzer:
     def extract_text_from_image(self, image_path: str) -> str:
         """Extract text from image files"""
         try:
-            custom_config = r'--oem 3 --psm 6 -l eng+hin+tel'
-            text = pytesseract.image_to_string(Image.open(image_path), config=custom_config)
-            if not text.strip():
-                text = pytesseract.image_to_string(Image.open(image_path))
+            with Image.open(image_path) as image:
+                image = binarize(image)
+                text = self._ocr(image)
+                if not text.strip():
+                    text = self._ocr(image, lang='eng', psm=3)
             return text
         except Exception as e:
             print(f"Error in image extraction: {str(e)}")
@@ -106,91 +272,98 @@ class DocumentAnalyzer:
 
     def translate_text(self, text: str, src_lang: str) -> str:
         """Improved translation handling for Indian tax documents"""
-        if src_lang == "en":
-            return text
+        translated, _ = self._translate(text, src_lang)
+        return text if translated is None else translated
+
+    def _translate(self, text: str, src_lang: str) -> Tuple[Optional[str], bool]:
+        """English translation of the text (None when skipped) and whether any chunk failed"""
+        if src_lang == "en" or len(text) < _MIN_TRANSLATE_CHARS:
+            return None, False
             
+        # Split into chunks to handle large texts
+        chunks = [text[i:i+_TRANSLATE_CHUNK_CHARS] for i in range(0, len(text), _TRANSLATE_CHUNK_CHARS)]
         try:
-            # Split into chunks to handle large texts
-            chunks = [text[i:i+5000] for i in range(0, len(text), 5000)]
-            translated = []
-            
-            for chunk in chunks:
-                try:
-                    translated.append(self.translator.translate(chunk, src=src_lang, dest='en').text)
-                except Exception as e:
-                    print(f"Translation error: {str(e)}")
-                    translated.append(chunk)  # Keep original if translation fails
-            
-            return ' '.join(translated)
+            translator = self.translator  # Create the client once, before the worker threads
         except Exception as e:
             print(f"Translation failed: {str(e)}")
-            return text
+            return None, True
+        
+        def translate_chunk(chunk):
+            try:
+                return translator.translate(chunk, src=src_lang, dest='en').text, False
+            except Exception as e:
+                print(f"Translation error: {str(e)}")
+                return chunk, True  # Keep original if translation fails
+        
+        # googletrans sends one request per chunk, so overlap the round-trips
+        with ThreadPoolExecutor(max_workers=min(_MAX_TRANSLATE_WORKERS, len(chunks))) as executor:
+            results = list(executor.map(translate_chunk, chunks))
+        return ' '.join(chunk for chunk, _ in results), any(failed for _, failed in results)
 
     def extract_pan_number(self, text: str) -> Optional[str]:
         """Extract PAN number with strict validation"""
-        pan_pattern = re.compile(r'[A-Z]{5}[0-9]{4}[A-Z]{1}')
-        match = pan_pattern.search(text)
+        match = _PAN_RE.search(text)
         return match.group() if match else None
 
     def extract_gstin(self, text: str) -> Optional[str]:
         """Extract GSTIN with strict validation"""
-        gstin_pattern = re.compile(r'\d{2}[A-Z]{5}\d{4}[A-Z]{1}[1-9A-Z]{1}Z[0-9A-Z]{1}')
-        match = gstin_pattern.search(text)
+        match = _GSTIN_RE.search(text)
         return match.group() if match else None
 
     def extract_dates(self, text: str) -> List[datetime]:
         """Extract dates in various formats used in Indian tax documents"""
-        date_formats = [
-            r'\d{1,2}/\d{1,2}/\d{4}',  # DD/MM/YYYY
-            r'\d{1,2}-\d{1,2}-\d{4}',  # DD-MM-YYYY
-            r'\d{4}-\d{1,2}-\d{1,2}',  # YYYY-MM-DD
-            r'\d{1,2}/\d{1,2}/\d{2}',  # DD/MM/YY
-        ]
-        
         dates = []
-        for fmt in date_formats:
-            matches = re.finditer(fmt, text)
-            for match in matches:
-                date_str = match.group()
-                try:
-                    if '/' in date_str:
-                        if len(date_str.split('/')[2]) == 2:
-                            date = datetime.strptime(date_str, '%d/%m/%y')
-                        else:
-                            date = datetime.strptime(date_str, '%d/%m/%Y')
-                    elif '-' in date_str:
-                        if len(date_str.split('-')[0]) == 4:
-                            date = datetime.strptime(date_str, '%Y-%m-%d')
-                        else:
-                            date = datetime.strptime(date_str, '%d-%m-%Y')
-                    dates.append(date)
-                except ValueError:
-                    continue
+        for match in _DATE_RE.finditer(text):
+            g = match.groups()
+            if g[0] is not None:
+                year, month, day = int(g[0]), int(g[1]), int(g[2])
+            elif g[3] is not None:
+                day, month, year = int(g[3]), int(g[4]), int(g[5])
+                if len(g[5]) == 2:
+                    # Same pivot as strptime's %y
+                    year += 2000 if year < 69 else 1900
+            else:
+                day, month, year = int(g[6]), int(g[7]), int(g[8])
+            try:
+                dates.append(datetime(year, month, day))
+            except ValueError:
+                continue
         return dates
 
     def extract_penalty_amount(self, text: str) -> Optional[MonetaryAmount]:
         """Extract penalty amount with currency"""
-        amount_patterns = [
-            r'Rs\.?\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)',  # Rs. 10,000.00
-            r'INR\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)',    # INR 10000
-            r'Penalty.*?\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)'  # Penalty: 10,000
-        ]
+        penalty_match = None
+        for match in _AMOUNT_RE.finditer(text):
+            if match.group('currency') or match.group('penalty_currency'):
+                break
+            if penalty_match is None:
+                penalty_match = match
+        else:
+            match = penalty_match
+        if match is None:
+            return None
         
-        for pattern in amount_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                try:
-                    amount = float(match.group(1).replace(',', ''))
-                    return MonetaryAmount(amount, "INR")
-                except ValueError:
-                    continue
-        return None
+        # Fold the digits directly instead of stripping commas and reparsing with float();
+        # int() also accepts Devanagari/Telugu digits, which \d matches in raw OCR text
+        whole = fraction = scale = 0
+        in_fraction = False
+        for c in match.group('amount'):
+            if c == ',':
+                continue
+            if c == '.':
+                in_fraction = True
+                continue
+            if in_fraction:
+                fraction = fraction * 10 + int(c)
+                scale += 1
+            else:
+                whole = whole * 10 + int(c)
+        return MonetaryAmount(whole + fraction / 10 ** scale, "INR")
 
     def extract_legal_sections(self, text: str) -> List[LegalSection]:
         """Extract legal sections mentioned in the document"""
-        section_pattern = r'Section\s*(\d+[A-Za-z]*(?:\s*\([^)]+\))?)'
-        sections = re.findall(section_pattern, text, re.IGNORECASE)
-        return [LegalSection(section.strip()) for section in sections]
+        # The captured group never has surrounding whitespace, so no strip is needed
+        return [LegalSection(match.group(1)) for match in _SECTION_RE.finditer(text)]
 
     def analyze_text(self, text: str) -> AnalysisResult:
         """Analyze extracted text with improved handling for tax documents"""
@@ -201,31 +374,30 @@ class DocumentAnalyzer:
             )
             
         lang = self.detect_document_language(text)
-        translated_text = self.translate_text(text, lang) if lang != "en" else text
         
-        # Extract all dates and use the most recent one as notice date
-        dates = self.extract_dates(translated_text)
+        # IDs, dates, amounts and section numbers survive OCR in any script,
+        # so these run on the original text
+        dates = self.extract_dates(text)
         notice_date = max(dates) if dates else None
+        pan_number = self.extract_pan_number(text)
+        gstin = self.extract_gstin(text)
+        penalty_amount = self.extract_penalty_amount(text)
+        legal_sections = self.extract_legal_sections(text)
         
-        # Extract other information
-        pan_number = self.extract_pan_number(translated_text)
-        gstin = self.extract_gstin(translated_text)
-        penalty_amount = self.extract_penalty_amount(translated_text)
-        legal_sections = self.extract_legal_sections(translated_text)
-        
-        # Determine notice type based on content
-        notice_type = None
-        notice_keywords = {
-            "Scrutiny Notice": ["scrutiny", "examination", "verification"],
-            "Demand Notice": ["demand", "payable", "outstanding"],
-            "Penalty Notice": ["penalty", "fine", "punishment"],
-            "Intimation": ["intimation", "information", "communication"]
-        }
-        
-        for nt, keywords in notice_keywords.items():
-            if any(re.search(kw, translated_text, re.IGNORECASE) for kw in keywords):
-                notice_type = nt
-                break
+        # Notice type and office are keyword based; translate only if the original text
+        # has no hit, or if NER was requested since the spaCy model is English-only
+        translated_text = None
+        translation_failed = False
+        notice_type = self.extract_notice_type(text)
+        issuing_office = self.extract_issuing_office(text)
+        if lang != "en" and (notice_type is None or issuing_office is None or self.use_ner):
+            translated_text, translation_failed = self._translate(text, lang)
+        if translated_text is not None:
+            notice_type = notice_type or self.extract_notice_type(translated_text)
+            issuing_office = issuing_office or self.extract_issuing_office(translated_text)
+            # Sections and amounts written with native-script words ("धारा", "रु.") only match in English
+            legal_sections = legal_sections or self.extract_legal_sections(translated_text)
+            penalty_amount = penalty_amount or self.extract_penalty_amount(translated_text)
         
         return AnalysisResult(
             metadata=Metadata(lang, 0.9),  # Assuming high confidence for demo
@@ -238,25 +410,121 @@ class DocumentAnalyzer:
             penalty_amount=penalty_amount,
             legal_sections=legal_sections,
             compliance_deadline=(max(dates) if len(dates) > 1 else None),
-            issuing_office=self.extract_issuing_office(translated_text)
+            issuing_office=issuing_office,
+            translation_failed=translation_failed
         )
 
+    def extract_notice_type(self, text: str) -> Optional[str]:
+        """Classify the notice by the first type keyword in the text"""
+        if _NOTICE_AUTOMATON is not None:
+            # Hits arrive ordered by end position; keep the one that starts first, like the regex
+            best_start, best_type = None, None
+            for end, (notice_type, length) in _NOTICE_AUTOMATON.iter(text.lower()):
+                start = end - length + 1
+                if best_start is None or start < best_start:
+                    best_start, best_type = start, notice_type
+                if end - _MAX_NOTICE_KEYWORD_LEN + 1 > best_start:
+                    break  # No later hit can start before the current best
+            return best_type
+        match = _NOTICE_CLASSIFIER.search(text)
+        return _GROUP_TO_NAME[match.lastgroup] if match else None
+
     def extract_issuing_office(self, text: str) -> Optional[str]:
         """Extract issuing office information"""
-        office_patterns = [
-            r'Issuing Office:\s*(.+)',
-            r'Office\s*of\s*the\s*(.+)',
-            r'[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s*Income Tax Office'
-        ]
-        
-        for pattern in office_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for office_re in _OFFICE_RES:
+            match = office_re.search(text)
             if match:
                 return match.group(1).strip()
         return None
 
+    def extract_entities(self, result: AnalysisResult, doc) -> None:
+        """Fill client name and issuing officer from a spaCy doc of the document text"""
+        persons = [ent for ent in doc.ents if ent.label_ == 'PERSON']
+        if persons:
+            result.client_name = persons[0].text
+        for sent in doc.sents:
+            if 'officer' in sent.text.lower():
+                officers = [ent for ent in sent.ents if ent.label_ == 'PERSON']
+                if officers:
+                    result.issuing_officer = officers[-1].text
+                    break
+
+    def process_documents(self, doc_paths: List[str], batch_size: int = 8) -> List[AnalysisResult]:
+        """Process several documents, batching the spaCy pass over all of them"""
+        results = []
+        analyzed = []
+        for doc_path in doc_paths:
+            cache_path = self._cache_path(doc_path)
+            if cache_path is not None and cache_path.exists():
+                try:
+                    with open(cache_path, 'rb') as f:
+                        results.append(pickle.load(f))
+                    continue
+                except Exception:
+                    pass  # Stale or corrupt entry; analyze again and overwrite it
+            
+            result = self._analyze_document(doc_path)
+            results.append(result)
+            # Error results carry a status message instead of document text
+            if result.metadata.confidence_score > 0:
+                analyzed.append((result, cache_path))
+        
+        # The English NER model only sees English or translated text
+        needs_ner = [
+            result for result, _ in analyzed
+            if result.translated_text is not None or result.metadata.original_language == "en"
+        ] if self.use_ner else []
+        ner_failed = False
+        if needs_ner:
+            try:
+                texts = [result.translated_text or result.text for result in needs_ner]
+                for result, doc in zip(needs_ner, self.nlp.pipe(texts, batch_size=batch_size)):
+                    self.extract_entities(result, doc)
+            except Exception as e:
+                # Keep the OCR and pattern results; only the entity fields are missing
+                print(f"Entity extraction failed: {str(e)}")
+                ner_failed = True
+        ner_ids = {id(result) for result in needs_ner}
+        
+        for result, cache_path in analyzed:
+            if cache_path is None or result.translation_failed or (ner_failed and id(result) in ner_ids):
+                continue  # Don't cache results that a retry could improve
+            try:
+                self._cache_dir.mkdir(parents=True, exist_ok=True)
+                with open(cache_path, 'wb') as f:
+                    pickle.dump(result, f)
+            except Exception as e:
+                print(f"Could not cache analysis result: {str(e)}")
+        return results
+
+    def _cache_path(self, doc_path: str) -> Optional[Path]:
+        """Cache file for a document's current contents, or None if caching is off or it cannot be read"""
+        if self._cache_dir is None:
+            return None
+        digest = hashlib.sha256()
+        try:
+            with open(doc_path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(block)
+        except OSError:
+            return None
+        # Results analyzed without NER lack entity fields, so they are cached separately
+        suffix = '' if self.use_ner else '-no-ner'
+        return self._cache_dir / f'v{_CACHE_VERSION}-{digest.hexdigest()}{suffix}.pkl'
+
+    def cache_clear(self) -> None:
+        """Remove all cached analysis results"""
+        if self._cache_dir is None:
+            return
+        for cache_file in self._cache_dir.glob('*.pkl'):
+            cache_file.unlink()
+
     def process_document(self, doc_path: str) -> AnalysisResult:
         """Main document processing method with comprehensive error handling"""
+        return self.process_documents([doc_path])[0]
+
+    def _analyze_document(self, doc_path: str) -> AnalysisResult:
+        """Extract and analyze a single document with comprehensive error handling"""
         try:
             if not os.path.exists(doc_path):
                 return AnalysisResult(
@@ -0,0 +1,88 @@
+from functools import lru_cache
+import numpy as np
+from PIL import Image
+
+# Pages smaller than this are handed to Tesseract untouched; binarizing them costs more than it saves
+MIN_BINARIZE_PIXELS = 250_000
+_LEVELS = np.arange(256, dtype=np.float64)
+
+def _otsu_threshold_numpy(hist: np.ndarray) -> int:
+    """Otsu threshold from a 256-bin histogram, vectorized over all candidate thresholds"""
+    hist = hist.astype(np.float64)
+    weight = np.cumsum(hist)
+    mean = np.cumsum(hist * _LEVELS)
+    total, total_mean = weight[-1], mean[-1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        between_var = (total_mean * weight - total * mean) ** 2 / (weight * (total - weight))
+    return int(np.argmax(np.nan_to_num(between_var)))
+
+def _binarize_packed_numpy(gray: np.ndarray, threshold: int) -> np.ndarray:
+    """Threshold a uint8 array into rows of packed bits, MSB first"""
+    return np.packbits(gray > threshold, axis=1)
+
+def _otsu_threshold_loop(hist):
+    total = 0.0
+    total_mean = 0.0
+    for level in range(256):
+        total += hist[level]
+        total_mean += level * hist[level]
+
+    best_level = 0
+    best_var = 0.0
+    weight = 0.0
+    mean = 0.0
+    for level in range(256):
+        weight += hist[level]
+        mean += level * hist[level]
+        if weight == 0.0 or weight == total:
+            continue
+        diff = total_mean * weight - total * mean
+        between_var = diff * diff / (weight * (total - weight))
+        if between_var > best_var:
+            best_var = between_var
+            best_level = level
+    return best_level
+
+def _binarize_packed_loop(gray, threshold):
+    height, width = gray.shape
+    out = np.zeros((height, (width + 7) // 8), dtype=np.uint8)
+    for row in range(height):
+        for col in range(width):
+            if gray[row, col] > threshold:
+                out[row, col >> 3] |= np.uint8(0x80 >> (col & 7))
+    return out
+
+@lru_cache(maxsize=None)
+def _jit_kernels():
+    """Numba-compiled (otsu, binarize) kernels, or None without numba"""
+    # Imported on the first page, not with the module, to keep analyzer startup cheap.
+    # The binarize kernel is serial on purpose: it runs inside the page thread pool,
+    # and Numba's default workqueue threading layer aborts on concurrent parallel regions
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return (njit(cache=True, fastmath=True)(_otsu_threshold_loop),
+            njit(cache=True)(_binarize_packed_loop))
+
+def otsu_threshold(gray: np.ndarray) -> int:
+    """Otsu threshold of a uint8 grayscale array"""
+    hist = np.bincount(gray.ravel(), minlength=256)
+    kernels = _jit_kernels()
+    if kernels is not None:
+        return int(kernels[0](hist.astype(np.float64)))
+    return _otsu_threshold_numpy(hist)
+
+def binarize(image: Image.Image) -> Image.Image:
+    """Binarize a page with Otsu's method so Tesseract can skip its own preprocessing"""
+    if image.width * image.height < MIN_BINARIZE_PIXELS:
+        return image
+    gray = np.ascontiguousarray(image.convert('L'), dtype=np.uint8)
+    threshold = otsu_threshold(gray)
+    kernels = _jit_kernels()
+    if kernels is not None:
+        packed = kernels[1](gray, threshold)
+    else:
+        packed = _binarize_packed_numpy(gray, threshold)
+    # Mode "1" raw data is exactly one packed, byte-padded row per scanline
+    return Image.frombytes('1', image.size, packed.tobytes())
@@ -24,22 +24,24 @@ def main():
     # Initialize the analyzer
     try:
         tesseract_path = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
-        analyzer = DocumentAnalyzer(tesseract_path)
+        analyzer = DocumentAnalyzer(tesseract_path, use_ner=True)
         
-        # Process each document
-        for doc in documents:
-            doc_path = os.path.join(test_dir, doc)
-            print(f"\nProcessing: {doc}")
+        # Process all documents in one batch
+        doc_paths = [os.path.join(test_dir, doc) for doc in documents]
+        results = analyzer.process_documents(doc_paths)
+        
+        for doc, result in zip(documents, results):
+            print(f"\nProcessed: {doc}")
             print("=" * 50)
             
-            result = analyzer.process_document(doc_path)
-            
             # Display results in a structured way
             print("\nExtracted Information:")
             print("-" * 50)
             print(f"Document Language: {result.metadata.original_language}")
             print(f"Confidence Score: {result.metadata.confidence_score:.0%}")
             
+            if result.client_name:
+                print(f"\nClient Name: {result.client_name}")
             if result.pan_number:
                 print(f"\nPAN Number: {result.pan_number}")
             if result.gstin:
@@ -60,6 +62,8 @@ def main():
                     
             if result.compliance_deadline:
                 print(f"\nCompliance Deadline: {result.compliance_deadline.strftime('%d-%m-%Y')}")
+            if result.issuing_officer:
+                print(f"Issuing Officer: {result.issuing_officer}")
             if result.issuing_office:
                 print(f"Issuing Office: {result.issuing_office}")
             
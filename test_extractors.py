@@ -0,0 +1,73 @@
+from datetime import datetime
+import pytest
+import legal_doc_analyzer
+from legal_doc_analyzer import DocumentAnalyzer
+
+@pytest.fixture
+def analyzer():
+    # The extractors are pure text functions; skip __init__ and its cache directory
+    return DocumentAnalyzer.__new__(DocumentAnalyzer)
+
+@pytest.mark.parametrize("text, expected", [
+    ("₹ १०,०००", 10000.0),  # Devanagari digits
+    ("Rs. ५००", 500.0),
+    ("Rs. ౨౫౦", 250.0),  # Telugu digits
+])
+def test_penalty_amount_native_digits(analyzer, text, expected):
+    assert analyzer.extract_penalty_amount(text).amount == expected
+
+@pytest.mark.parametrize("text, expected", [
+    ("Penalty u/s 270A: Rs. 25,000", 25000.0),
+    ("Penalty under section 271(1)(c) of Rs. 50,000", 50000.0),
+    ("Penalty: 2,500", 2500.0),
+    ("INR 10,000.50 payable", 10000.5),
+    ("Penalty: Rs. 5,000 imposed. Late fee of Rs. 100 also payable.", 5000.0),
+    ("Penalty of INR 5,000; processing charge INR 200", 5000.0),
+])
+def test_penalty_amount_prefers_currency_prefix(analyzer, text, expected):
+    assert analyzer.extract_penalty_amount(text).amount == expected
+
+def test_penalty_amount_missing(analyzer):
+    assert analyzer.extract_penalty_amount("No amounts here") is None
+
+@pytest.mark.parametrize("text, expected", [
+    ("Dated 12/05/2024", [datetime(2024, 5, 12)]),  # DD/MM/YYYY, no spurious DD/MM/YY duplicate
+    ("Dated 05-06-2022", [datetime(2022, 6, 5)]),   # DD-MM-YYYY
+    ("Dated 2023-1-31", [datetime(2023, 1, 31)]),   # YYYY-MM-DD
+    ("Dated 3/4/24", [datetime(2024, 4, 3)]),       # DD/MM/YY
+    ("Dated 3/4/68", [datetime(2068, 4, 3)]),       # %y pivot: 00-68 -> 20xx
+    ("Dated 3/4/69", [datetime(1969, 4, 3)]),       # %y pivot: 69-99 -> 19xx
+    ("दिनांक १२/०५/२०२४", [datetime(2024, 5, 12)]),  # Devanagari digits
+    ("Dated 31/02/2020", []),                        # impossible date is skipped
+    ("Issued 01/04/2024, reply by 15/04/2024", [datetime(2024, 4, 1), datetime(2024, 4, 15)]),
+])
+def test_extract_dates(analyzer, text, expected):
+    assert analyzer.extract_dates(text) == expected
+
+@pytest.fixture(params=["regex", "aho-corasick"])
+def notice_classifier(request, monkeypatch):
+    # Exercise both classifier paths; the automaton one needs pyahocorasick
+    if request.param == "regex":
+        monkeypatch.setattr(legal_doc_analyzer, "_NOTICE_AUTOMATON", None)
+    else:
+        automaton = legal_doc_analyzer._build_notice_automaton()
+        if automaton is None:
+            pytest.skip("pyahocorasick not installed")
+        monkeypatch.setattr(legal_doc_analyzer, "_NOTICE_AUTOMATON", automaton)
+    return request.param
+
+@pytest.mark.parametrize("text, expected", [
+    ("Notice for SCRUTINY of return", "Scrutiny Notice"),
+    ("Amount outstanding as per records", "Demand Notice"),
+    ("Show cause for levy of penalty", "Penalty Notice"),
+    ("Intimation under section 143(1)", "Intimation"),
+    # First keyword in the text wins, not the first type in the keyword table
+    ("This intimation concerns the demand raised after scrutiny", "Intimation"),
+    ("Penalty payable on verification", "Penalty Notice"),
+    # Overlapping keywords sharing a letter: the one that starts first wins
+    ("payablexamination", "Demand Notice"),
+    ("outstandingdemand penalty", "Demand Notice"),
+    ("Nothing relevant here", None),
+])
+def test_extract_notice_type(analyzer, notice_classifier, text, expected):
+    assert analyzer.extract_notice_type(text) == expected